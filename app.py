@@ -12,14 +12,31 @@ for automating Splunk dashboard interactions. It includes:
 """
 
 from flask import Flask, render_template, request, jsonify, session, send_file
+from flask.json.provider import DefaultJSONProvider
 import os
 import json
 import asyncio
+import atexit
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pytz
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler
+
+# uvloop is an optional, faster drop-in event loop (not available on Windows)
+try:
+    if os.name == 'nt':
+        raise ImportError("uvloop is not supported on Windows")
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# orjson is an optional, faster JSON encoder/decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Custom utility imports
 from utils.config import Config, Theme
@@ -27,27 +44,59 @@ from utils.encryption import save_credentials, load_credentials
 from utils.screenshot import ScreenshotManager
 from utils.scheduler import ScheduleManager
 from utils.dashboard_manager import DashboardManager
+from utils.models import Credentials, Dashboard, Schedule, ListIn, RenameIn, DeleteIn, IdIn, ScreenshotIn
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Match Flask's own output: keys sorted, and datetimes passed through to
+        # self.default so they keep Flask's HTTP-date format instead of ISO 8601
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 app.secret_key = os.getenv('SECRET_KEY', 'your-secret-key-change-this-in-production')
 
+# Upper bound on capture jobs running at once on the shared loop, and on
+# threads doing their blocking watermark and file work
+SCREENSHOT_WORKERS = int(os.getenv('SCREENSHOT_WORKERS', '4'))
+_EXEC = ThreadPoolExecutor(max_workers=SCREENSHOT_WORKERS, thread_name_prefix='shot')
+atexit.register(_EXEC.shutdown)
+
 # Initialize managers
 dashboard_manager = DashboardManager()
-screenshot_manager = ScreenshotManager()
+screenshot_manager = ScreenshotManager(executor=_EXEC)
 schedule_manager = ScheduleManager()
 
+def _setup_logging():
+    """Configure root logging once, skipping it if handlers already exist"""
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    os.makedirs(Config.LOG_DIR, exist_ok=True)
+    # A fixed file name rotated at midnight replaces the per-day file name
+    log_file = os.path.join(Config.LOG_DIR, "app.log")
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[
+            TimedRotatingFileHandler(log_file, when='midnight', backupCount=5),
+            logging.StreamHandler()
+        ]
+    )
+
 # Setup logging
-os.makedirs(Config.LOG_DIR, exist_ok=True)
-log_file = os.path.join(Config.LOG_DIR, f"app_{datetime.now().strftime('%Y%m%d')}.log")
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=5),
-        logging.StreamHandler()
-    ]
-)
+_setup_logging()
 logger = logging.getLogger(__name__)
 
 @app.route('/')
@@ -58,37 +107,46 @@ def index():
     theme = settings.get('theme', 'light')
     
     # Get dashboard data
-    dashboards = dashboard_manager.get_all_dashboards()
-    lists = dashboard_manager.get_all_lists()
-    schedules = schedule_manager.get_all_schedules()
+    dashboard_data = dashboard_manager.snapshot()
+    schedule_data = schedule_manager.snapshot()
     
     return render_template('index.html', 
-                         dashboards=dashboards,
-                         lists=lists,
-                         schedules=schedules,
+                         dashboards=dashboard_data['dashboards'],
+                         lists=dashboard_data['lists'],
+                         schedules=schedule_data['schedules'],
                          theme=theme)
 
 @app.route('/api/credentials', methods=['GET', 'POST'])
 def handle_credentials():
     """Handle credential management with secure encryption"""
     if request.method == 'GET':
+        # The secrets file's modification time identifies the stored credentials,
+        # so unchanged credentials can be answered with 304 Not Modified
+        try:
+            etag = str(os.stat(Config.SECRETS_FILE).st_mtime_ns)
+        except OSError:
+            etag = 'none'
+        if request.if_none_match.contains(etag):
+            return '', 304
+        
         username, password = load_credentials()
-        return jsonify({
+        response = jsonify({
             'has_credentials': username is not None and password is not None,
             'username': username if username else ''
         })
+        response.set_etag(etag)
+        response.cache_control.private = True
+        return response
     
     elif request.method == 'POST':
-        data = request.get_json() or {}
-        username = data.get('username', '').strip()
-        password = data.get('password', '').strip()
+        credentials = Credentials.from_request(request.get_json() or {})
         
-        if not username or not password:
+        if not credentials.username or not credentials.password:
             return jsonify({'success': False, 'error': 'Username and password are required'}), 400
         
-        success = save_credentials(username, password)
+        success = save_credentials(credentials.username, credentials.password)
         if success:
-            logger.info(f"Credentials saved for user: {username}")
+            logger.info(f"Credentials saved for user: {credentials.username}")
             return jsonify({'success': True})
         else:
             return jsonify({'success': False, 'error': 'Failed to save credentials'}), 500
@@ -102,32 +160,29 @@ def handle_dashboards():
     
     elif request.method == 'POST':
         data = request.get_json() or {}
-        dashboard = {
-            'id': dashboard_manager.generate_id(),
-            'name': data.get('name', '').strip(),
-            'url': data.get('url', '').strip(),
-            'lists': data.get('lists', []),
-            'selected': False,
-            'status': 'Ready',
-            'created_at': datetime.now().isoformat()
-        }
+        dashboard = Dashboard.from_request(
+            data,
+            id=dashboard_manager.generate_id(),
+            created_at=datetime.now().isoformat()
+        )
         
         # Validation
-        if not dashboard['name']:
+        if not dashboard.name:
             return jsonify({'success': False, 'error': 'Dashboard name is required'}), 400
-        if not dashboard['url']:
+        if not dashboard.url:
             return jsonify({'success': False, 'error': 'Dashboard URL is required'}), 400
         
-        success = dashboard_manager.add_dashboard(dashboard)
+        dashboard_data = dashboard.to_dict()
+        success = dashboard_manager.add_dashboard(dashboard_data)
         if success:
-            logger.info(f"Added dashboard: {dashboard['name']}")
-            return jsonify({'success': True, 'dashboard': dashboard})
+            logger.info(f"Added dashboard: {dashboard.name}")
+            return jsonify({'success': True, 'dashboard': dashboard_data})
         else:
             return jsonify({'success': False, 'error': 'Failed to add dashboard'}), 500
     
     elif request.method == 'PUT':
         data = request.get_json() or {}
-        dashboard_id = data.get('id')
+        dashboard_id = IdIn.from_request(data).id
         if not dashboard_id:
             return jsonify({'success': False, 'error': 'Dashboard ID is required'}), 400
         
@@ -139,8 +194,7 @@ def handle_dashboards():
             return jsonify({'success': False, 'error': 'Failed to update dashboard'}), 500
     
     elif request.method == 'DELETE':
-        data = request.get_json() or {}
-        dashboard_ids = data.get('ids', [])
+        dashboard_ids = DeleteIn.from_request(request.get_json() or {}).ids
         if not dashboard_ids:
             return jsonify({'success': False, 'error': 'No dashboards selected'}), 400
         
@@ -160,8 +214,7 @@ def handle_lists():
         return jsonify(lists)
     
     elif request.method == 'POST':
-        data = request.get_json() or {}
-        list_name = data.get('name', '').strip()
+        list_name = ListIn.from_request(request.get_json() or {}).name
         
         if not list_name:
             return jsonify({'success': False, 'error': 'List name is required'}), 400
@@ -174,9 +227,8 @@ def handle_lists():
             return jsonify({'success': False, 'error': 'List already exists'}), 400
     
     elif request.method == 'PUT':
-        data = request.get_json() or {}
-        old_name = data.get('old_name', '').strip()
-        new_name = data.get('new_name', '').strip()
+        rename = RenameIn.from_request(request.get_json() or {})
+        old_name, new_name = rename.old_name, rename.new_name
         
         if not old_name or not new_name:
             return jsonify({'success': False, 'error': 'Both old and new names are required'}), 400
@@ -189,8 +241,7 @@ def handle_lists():
             return jsonify({'success': False, 'error': 'Failed to rename list'}), 500
     
     elif request.method == 'DELETE':
-        data = request.get_json() or {}
-        list_name = data.get('name', '').strip()
+        list_name = ListIn.from_request(request.get_json() or {}).name
         if not list_name:
             return jsonify({'success': False, 'error': 'List name is required'}), 400
         
@@ -204,12 +255,9 @@ def handle_lists():
 @app.route('/api/screenshot', methods=['POST'])
 def capture_screenshot():
     """Capture screenshots of selected dashboards"""
-    data = request.get_json() or {}
-    dashboard_ids = data.get('dashboard_ids', [])
-    include_watermark = data.get('include_watermark', True)
-    time_range = data.get('time_range', {})
+    shot = ScreenshotIn.from_request(request.get_json() or {})
     
-    if not dashboard_ids:
+    if not shot.dashboard_ids:
         return jsonify({'success': False, 'error': 'No dashboards selected'}), 400
     
     # Get credentials
@@ -217,38 +265,67 @@ def capture_screenshot():
     if not username or not password:
         return jsonify({'success': False, 'error': 'Credentials not configured'}), 400
     
-    # Start screenshot capture in background
-    thread = threading.Thread(
-        target=_capture_screenshots_async,
-        args=(dashboard_ids, username, password, include_watermark, time_range)
+    # Hand the capture off to the shared background event loop
+    asyncio.run_coroutine_threadsafe(
+        _capture_screenshots_async(shot.dashboard_ids, username, password, shot.include_watermark, shot.time_range),
+        _get_screenshot_loop()
     )
-    thread.start()
     
     return jsonify({'success': True, 'message': 'Screenshot capture started'})
 
-def _capture_screenshots_async(dashboard_ids, username, password, include_watermark, time_range):
+def _new_event_loop():
+    """Create a new event loop, preferring uvloop when it is installed"""
+    if uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    
+    # Run tasks eagerly until their first real suspension (Python 3.12+)
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+# Long-lived event loop shared by all screenshot requests
+_screenshot_loop = None
+_screenshot_loop_lock = threading.Lock()
+
+_screenshot_slots = asyncio.Semaphore(SCREENSHOT_WORKERS)
+
+def _get_screenshot_loop():
+    """
+    Get the shared screenshot event loop, starting its thread on first use.
+    
+    Returns:
+        asyncio.AbstractEventLoop: Event loop running in a daemon thread
+    """
+    global _screenshot_loop
+    with _screenshot_loop_lock:
+        if _screenshot_loop is None:
+            loop = _new_event_loop()
+            
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.run_forever()
+            
+            threading.Thread(target=run_loop, name="ScreenshotLoop", daemon=True).start()
+            atexit.register(loop.call_soon_threadsafe, loop.stop)
+            _screenshot_loop = loop
+            logger.info("Screenshot event loop started")
+        return _screenshot_loop
+
+async def _capture_screenshots_async(dashboard_ids, username, password, include_watermark, time_range):
     """Async function to capture screenshots"""
     try:
-        # Check if there's already a running loop
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        dashboards = dashboard_manager.get_dashboards_by_ids(dashboard_ids)
-        result = loop.run_until_complete(
-            screenshot_manager.capture_screenshots(
+        async with _screenshot_slots:
+            dashboards = dashboard_manager.get_dashboards_by_ids(dashboard_ids)
+            result = await screenshot_manager.capture_screenshots(
                 dashboards, username, password, include_watermark, time_range
             )
-        )
         
         logger.info(f"Screenshot capture completed: {result}")
     except Exception as e:
         logger.error(f"Screenshot capture failed: {e}")
-    finally:
-        if 'loop' in locals() and not loop.is_running():
-            loop.close()
 
 @app.route('/api/schedules', methods=['GET', 'POST', 'PUT', 'DELETE'])
 def handle_schedules():
@@ -259,34 +336,29 @@ def handle_schedules():
     
     elif request.method == 'POST':
         data = request.get_json() or {}
-        schedule = {
-            'id': schedule_manager.generate_id(),
-            'name': data.get('name', '').strip(),
-            'dashboard_ids': data.get('dashboard_ids', []),
-            'schedule_type': data.get('schedule_type', 'once'),
-            'schedule_time': data.get('schedule_time', ''),
-            'time_range': data.get('time_range', {}),
-            'include_watermark': data.get('include_watermark', True),
-            'active': True,
-            'created_at': datetime.now().isoformat()
-        }
+        schedule = Schedule.from_request(
+            data,
+            id=schedule_manager.generate_id(),
+            created_at=datetime.now().isoformat()
+        )
         
         # Validation
-        if not schedule['name']:
+        if not schedule.name:
             return jsonify({'success': False, 'error': 'Schedule name is required'}), 400
-        if not schedule['dashboard_ids']:
+        if not schedule.dashboard_ids:
             return jsonify({'success': False, 'error': 'At least one dashboard must be selected'}), 400
         
-        success = schedule_manager.add_schedule(schedule)
+        schedule_data = schedule.to_dict()
+        success = schedule_manager.add_schedule(schedule_data)
         if success:
-            logger.info(f"Added schedule: {schedule['name']}")
-            return jsonify({'success': True, 'schedule': schedule})
+            logger.info(f"Added schedule: {schedule.name}")
+            return jsonify({'success': True, 'schedule': schedule_data})
         else:
             return jsonify({'success': False, 'error': 'Failed to add schedule'}), 500
     
     elif request.method == 'PUT':
         data = request.get_json() or {}
-        schedule_id = data.get('id')
+        schedule_id = IdIn.from_request(data).id
         if not schedule_id:
             return jsonify({'success': False, 'error': 'Schedule ID is required'}), 400
         
@@ -298,8 +370,7 @@ def handle_schedules():
             return jsonify({'success': False, 'error': 'Failed to update schedule'}), 500
     
     elif request.method == 'DELETE':
-        data = request.get_json() or {}
-        schedule_id = data.get('id')
+        schedule_id = IdIn.from_request(request.get_json() or {}).id
         if not schedule_id:
             return jsonify({'success': False, 'error': 'Schedule ID is required'}), 400
         
@@ -325,12 +396,27 @@ def handle_settings():
         else:
             return jsonify({'success': False, 'error': 'Failed to save settings'}), 500
 
+# Parsed settings keyed on the settings file's modification time
+_settings_cache = {'mtime': None, 'data': None}
+
 def load_user_settings():
-    """Load user settings from file"""
+    """Load user settings from file, reusing the cached copy while unchanged"""
     try:
-        if os.path.exists(Config.SETTINGS_FILE):
+        mtime = os.stat(Config.SETTINGS_FILE).st_mtime
+        if _settings_cache['data'] is not None and _settings_cache['mtime'] == mtime:
+            return dict(_settings_cache['data'])
+        
+        if orjson is not None:
+            with open(Config.SETTINGS_FILE, 'rb') as f:
+                settings = orjson.loads(f.read())
+        else:
             with open(Config.SETTINGS_FILE, 'r') as f:
-                return json.load(f)
+                settings = json.load(f)
+        _settings_cache['mtime'] = mtime
+        _settings_cache['data'] = settings
+        return dict(settings)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.error(f"Error loading settings: {e}")
     
@@ -345,8 +431,16 @@ def load_user_settings():
 def save_user_settings(settings):
     """Save user settings to file"""
     try:
-        with open(Config.SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        if orjson is not None:
+            with open(Config.SETTINGS_FILE, 'wb') as f:
+                f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+        else:
+            with open(Config.SETTINGS_FILE, 'w') as f:
+                json.dump(settings, f, indent=2)
+        
+        # Update the cache directly rather than forcing a re-read
+        _settings_cache['mtime'] = os.stat(Config.SETTINGS_FILE).st_mtime
+        _settings_cache['data'] = dict(settings)
         return True
     except Exception as e:
         logger.error(f"Error saving settings: {e}")
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, Toplevel, filedialog
 import asyncio
-from datetime import datetime, timedelta, time as dt_time
+from datetime import datetime, date, timedelta, time as dt_time
 import pytz
 import os
 import sys
@@ -9,24 +9,24 @@ import re
 import json
 from urllib.parse import urlencode
 from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler
 import shutil
-import keyring
+import functools
+import atexit
+import importlib.util
 from cryptography.fernet import Fernet 
-from PIL import Image, ImageDraw, ImageFont
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import io
 
-try:
-    from tkcalendar import DateEntry
-except ImportError:
-    messagebox.showerror("Dependency Error", "The 'tkcalendar' library is not found. Please install it by running:\npip install tkcalendar")
-    sys.exit(1)
-try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-except ImportError:
-    messagebox.showerror("Dependency Error", "The 'playwright' library is not found. Please install it by running:\npip install playwright")
-    sys.exit(1)
+# Playwright, Pillow and tkcalendar are slow to import, so they are imported where they
+# are first used; at startup only check that they are installed.
+for _module, _package in (("tkcalendar", "tkcalendar"), ("playwright", "playwright"), ("PIL", "pillow")):
+    if importlib.util.find_spec(_module) is None:
+        messagebox.showerror("Dependency Error", f"The '{_package}' library is not found. Please install it by running:\npip install {_package}")
+        sys.exit(1)
 
 class Config:
     """Configuration constants for the app."""
@@ -46,66 +46,147 @@ def ensure_dirs():
     logger.info(f"Ensured directories exist: {Config.TMP_DIR}, {Config.SCREENSHOT_ARCHIVE_DIR}")
     logger.info(f"Current working directory: {os.getcwd()}")
 
+def atomic_write_bytes(path: str, data: bytes, mode: int = 0o600, sync: bool = True) -> None:
+    """Write data to a temp file and os.replace it over path, so a crash never leaves a truncated file.
+    sync=False skips the fsync, for frequently rewritten files that are cheap to lose (settings)."""
+    tmp = f"{path}.tmp"
+    try:
+        os.unlink(tmp)  # a stale tmp would keep its old permissions; os.open only applies mode on create
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    with open(fd, "wb", buffering=131072) as f:
+        f.write(data)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 # ------------------------------------------------------------------------------
 # Logging Setup
 # ------------------------------------------------------------------------------
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that counts written bytes instead of checking the file on every record."""
+    BUFFER_SIZE = 256 * 1024
+
+    def __init__(self, filename, *args, **kwargs):
+        self._defer_flush = False
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._est_size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._est_size = 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding or 'utf-8', errors=self.errors)
+
+    def emit(self, record):
+        # StreamHandler flushes after every record; let INFO/DEBUG fill the
+        # buffer and only push it out for warnings and errors.
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        size = len(self.format(record)) + len(self.terminator)
+        self._est_size += size
+        if self._est_size >= self.maxBytes:
+            # The record goes into the fresh file, so it starts the new count.
+            self._est_size = size
+            return True
+        return False
+
 log_file = os.path.join(Config.LOG_DIR, f"analysis_{datetime.now().strftime('%Y%m%d')}.log")
 logger = logging.getLogger("SplunkAutomator")
 logger.setLevel(logging.INFO)
-handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=5)
+handler = FastRotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=3)
 formatter = logging.Formatter('%(asctime)s [%(levelname)s] (%(threadName)s) %(message)s')
 handler.setFormatter(formatter)
-logger.addHandler(handler)
+# Collect records in memory and hand them to the file in batches; errors flush straight away.
+mem_handler = MemoryHandler(1024, flushLevel=logging.ERROR, target=handler, flushOnClose=True)
+logger.addHandler(mem_handler)
 logger.addHandler(logging.StreamHandler(sys.stdout))
+atexit.register(handler.flush)
+atexit.register(mem_handler.flush)
 
 # ------------------------------------------------------------------------------
 # Archiving and Cleanup
 # ------------------------------------------------------------------------------
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
 def archive_and_clean_tmp() -> None:
     """Move all subfolders in tmp (except today's) to screenshots, and clean tmp for the new run."""
     ensure_dirs()
     today_str = datetime.now().strftime("%Y-%m-%d")
-    for folder in os.listdir(Config.TMP_DIR):
-        folder_path = os.path.join(Config.TMP_DIR, folder)
-        if os.path.isdir(folder_path) and folder != today_str:
-            archive_path = os.path.join(Config.SCREENSHOT_ARCHIVE_DIR, folder)
-            if os.path.exists(archive_path):
-                shutil.rmtree(archive_path)
-            shutil.move(folder_path, archive_path)
-            logger.info(f"Archived {folder_path} to {archive_path}")
-    for fname in os.listdir(Config.TMP_DIR):
-        fpath = os.path.join(Config.TMP_DIR, fname)
-        if os.path.isfile(fpath):
-            os.remove(fpath)
-            logger.info(f"Removed stray file {fpath} from tmp")
+    # scandir entries carry their file type, so no extra stat per entry.
+    with os.scandir(Config.TMP_DIR) as it:
+        for entry in it:
+            if entry.is_dir():
+                if entry.name == today_str:
+                    continue
+                archive_path = os.path.join(Config.SCREENSHOT_ARCHIVE_DIR, entry.name)
+                try:
+                    os.rename(entry.path, archive_path)
+                except OSError:
+                    # Already archived (rename won't replace a non-empty folder) or on another filesystem.
+                    if os.path.exists(archive_path):
+                        shutil.rmtree(archive_path)
+                    shutil.move(entry.path, archive_path)
+                logger.info(f"Archived {entry.path} to {archive_path}")
+            elif entry.is_file():
+                os.remove(entry.path)
+                logger.info(f"Removed stray file {entry.path} from tmp")
+
+def _delete_archive_entry(item) -> None:
+    """Delete one file or subfolder of an expired archive folder."""
+    path, is_dir = item
+    try:
+        if is_dir:
+            shutil.rmtree(path)
+            logger.info(f"Deleted subfolder: {path}")
+        else:
+            os.remove(path)
+            logger.info(f"Deleted file: {path}")
+    except Exception as e:
+        logger.warning(f"Failed to delete {path}: {e}")
 
 def purge_old_archives() -> None:
     """Purge contents of archive folders older than DAYS_TO_KEEP."""
     now = datetime.now()
+    today_ordinal = now.toordinal()
     logger.info(f"Purging contents of archives older than {Config.DAYS_TO_KEEP} days. Now: {now}")
-    for folder in os.listdir(Config.SCREENSHOT_ARCHIVE_DIR):
-        folder_path = os.path.join(Config.SCREENSHOT_ARCHIVE_DIR, folder)
-        if not os.path.isdir(folder_path):
-            continue
-        try:
-            folder_date = datetime.strptime(folder, "%Y-%m-%d")
-            age = (now - folder_date).days
-            logger.info(f"Found archive: {folder} (age: {age} days)")
-            if age > Config.DAYS_TO_KEEP:
-                for filename in os.listdir(folder_path):
-                    file_path = os.path.join(folder_path, filename)
-                    try:
-                        if os.path.isfile(file_path) or os.path.islink(file_path):
-                            os.remove(file_path)
-                            logger.info(f"Deleted file: {file_path}")
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
-                            logger.info(f"Deleted subfolder: {file_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete {file_path}: {e}")
-                logger.info(f"Purged all contents of archive folder: {folder_path} (folder left intact)")
-        except ValueError:
-            logger.warning(f"Skipping non-date folder: {folder}")
+    # Deletes are I/O bound, so a few threads clear a large folder much faster.
+    with ThreadPoolExecutor(max_workers=8) as executor, os.scandir(Config.SCREENSHOT_ARCHIVE_DIR) as folders:
+        for folder in folders:
+            if not folder.is_dir():
+                continue
+            try:
+                m = _DATE_RE.match(folder.name)
+                if not m:
+                    raise ValueError(folder.name)
+                age = today_ordinal - date(*map(int, m.groups())).toordinal()
+                logger.info(f"Found archive: {folder.name} (age: {age} days)")
+                if age > Config.DAYS_TO_KEEP:
+                    items = []
+                    with os.scandir(folder.path) as files:
+                        for entry in files:
+                            if entry.is_file() or entry.is_symlink():
+                                items.append((entry.path, False))
+                            elif entry.is_dir():
+                                items.append((entry.path, True))
+                    list(executor.map(_delete_archive_entry, items))
+                    logger.info(f"Purged all contents of archive folder: {folder.path} (folder left intact)")
+            except ValueError:
+                logger.warning(f"Skipping non-date folder: {folder.name}")
 
 '''def save_screenshot_to_tmp(screenshot_bytes: bytes, filename: str) -> str:
     """Save screenshot bytes to today's tmp directory."""
@@ -119,29 +200,48 @@ def purge_old_archives() -> None:
     logger.info(f"Saved screenshot to {file_path}")
     return file_path'''
 
-def save_screenshot_to_tmp(screenshot_bytes: bytes, filename: str) -> str:
-    ensure_dirs()
+_ensured_day = None
+
+@functools.lru_cache(maxsize=1)
+def _overlay_font():
+    """Load the timestamp overlay font once per process."""
+    from PIL import ImageFont
+    return ImageFont.truetype("arial.ttf", 24) if os.path.exists("arial.ttf") else ImageFont.load_default()
+
+def _ensure_today_dir() -> str:
+    """Return today's tmp directory, creating the directories only once per day."""
+    global _ensured_day
     today_str = datetime.now().strftime("%Y-%m-%d")
     day_tmp_dir = os.path.join(Config.TMP_DIR, today_str)
-    os.makedirs(day_tmp_dir, exist_ok=True)
-    file_path = os.path.join(day_tmp_dir, filename)
+    if today_str != _ensured_day:
+        ensure_dirs()
+        os.makedirs(day_tmp_dir, exist_ok=True)
+        _ensured_day = today_str
+    return day_tmp_dir
+
+def save_screenshot_to_tmp(screenshot_bytes: bytes, filename: str) -> str:
+    from PIL import Image, ImageDraw
+    file_path = os.path.join(_ensure_today_dir(), filename)
     # Overlay timestamp
     image = Image.open(io.BytesIO(screenshot_bytes))
     draw = ImageDraw.Draw(image)
     timestamp = datetime.now(Config.EST).strftime("%Y-%m-%d %H:%M:%S %Z")
-    font = ImageFont.truetype("arial.ttf", 24) if os.path.exists("arial.ttf") else None
-    draw.text((10, 10), f"Captured: {timestamp}", fill="white", font=font)
-    image.save(file_path)
+    draw.text((10, 10), f"Captured: {timestamp}", fill="white", font=_overlay_font())
+    # zlib level 1: most of the save time is compression, and screenshots are short-lived tmp files.
+    image.save(file_path, optimize=False, compress_level=1)
     logger.info(f"Saved screenshot to {file_path}")
     return file_path
 
 def load_credentials():
     if not os.path.exists(".secrets"):
         return None, None
-    key = get_key()
-    f = Fernet(key)
     with open(".secrets", "rb") as f2:
-        decrypted = f.decrypt(f2.read())
+        blob = f2.read()
+    try:
+        decrypted = _get_aead().decrypt(blob[:12], blob[12:], None)
+    except InvalidTag:
+        # .secrets written before the switch to AES-GCM is a Fernet token under the old key.
+        decrypted = Fernet(get_key()).decrypt(blob)
     data = json.loads(decrypted.decode())
     return data.get("username"), data.get("password")
 
@@ -167,29 +267,62 @@ def save_credentials(username: str, password: str) -> bool:
         return False'''
 
 def get_key():
+    """Fernet key, now only used to read .secrets files written before AES-GCM."""
     key_file = ".secrets.key"
     if os.path.exists(key_file):
         with open(key_file, "rb") as f:
             return f.read()
     key = Fernet.generate_key()
-    with open(key_file, "wb") as f:
-        f.write(key)
+    atomic_write_bytes(key_file, key)
     return key
 
+def get_aead_key():
+    """AES-256-GCM key for .secrets, kept in its own file apart from the Fernet key."""
+    key_file = ".secrets.aes.key"
+    if os.path.exists(key_file):
+        with open(key_file, "rb") as f:
+            return f.read()
+    key = AESGCM.generate_key(bit_length=256)
+    atomic_write_bytes(key_file, key)
+    return key
+
+@functools.lru_cache(maxsize=1)
+def _get_aead() -> AESGCM:
+    """AES-256-GCM cipher for the local key, built once per process (call cache_clear() after replacing the key)."""
+    return AESGCM(get_aead_key())
+
 def save_credentials(username, password):
-    key = get_key()
-    f = Fernet(key)
     creds = json.dumps({"username": username, "password": password}).encode()
-    encrypted = f.encrypt(creds)
-    with open(".secrets", "wb") as f2:
-        f2.write(encrypted)
+    nonce = os.urandom(12)
+    encrypted = nonce + _get_aead().encrypt(nonce, creds, None)
+    atomic_write_bytes(".secrets", encrypted)
     logger.info("Credentials saved securely (encrypted).")
 
 # ------------------------------------------------------------------------------
 # Time Range Dialog Class - UPDATED FOR SPLUNK TIME MODIFIERS
 # ------------------------------------------------------------------------------
+_TIME_RE = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)(?::([0-5]\d))?$')
+
 class TimeRangeDialog(Toplevel):
     """Dialog window for selecting time range for Splunk queries."""
+    PRESET_SPLUNK_RANGES = {
+        "Last 15 minutes": ("-15m@m", "now"),
+        "Last 60 minutes": ("-60m@m", "now"),
+        "Last 4 hours": ("-4h@h", "now"),
+        "Last 24 hours": ("-24h@h", "now"),
+        "Last 7 days": ("-7d@d", "now"),
+        "Last 30 days": ("-30d@d", "now"),
+        "Today": ("@d", "now"),
+        "Yesterday": ("-1d@d", "@d"),
+        "Previous week": ("-1w@w", "@w"),
+        "Previous month": ("-1mon@mon", "@mon"),
+        "Previous year": ("-1y@y", "@y"),
+        "Week to date": ("@w", "now"),
+        "Month to date": ("@mon", "now"),
+        "Year to date": ("@y", "now"),
+        "All time": ("0", "now"),
+    }
+
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Select Time Range (EST)")
@@ -217,11 +350,15 @@ class TimeRangeDialog(Toplevel):
         self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
         self.frames = {option: ttk.Frame(self.content_frame) for option in options}
-        self.build_presets_frame(self.frames["Presets"])
-        self.build_relative_frame(self.frames["Relative"])
-        self.build_date_range_frame(self.frames["Date Range"])
-        self.build_datetime_range_frame(self.frames["Date & Time Range"])
-        self.build_advanced_frame(self.frames["Advanced"])
+        # Frames are filled in the first time they are shown; DateEntry widgets are slow to build.
+        self._builders = {
+            "Presets": self.build_presets_frame,
+            "Relative": self.build_relative_frame,
+            "Date Range": self.build_date_range_frame,
+            "Date & Time Range": self.build_datetime_range_frame,
+            "Advanced": self.build_advanced_frame,
+        }
+        self._built = set()
 
         btn_frame = ttk.Frame(self)
         btn_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -232,29 +369,16 @@ class TimeRangeDialog(Toplevel):
         self.focus_set()
 
     def show_selected_frame(self):
+        option = self.option_var.get()
+        if option not in self._built:
+            self._builders[option](self.frames[option])
+            self._built.add(option)
         for frame in self.frames.values():
             frame.pack_forget()
-        self.frames[self.option_var.get()].pack(fill=tk.BOTH, expand=True)
+        self.frames[option].pack(fill=tk.BOTH, expand=True)
 
     def build_presets_frame(self, parent):
-        self.preset_splunk_ranges = {
-            "Last 15 minutes": ("-15m@m", "now"),
-            "Last 60 minutes": ("-60m@m", "now"),
-            "Last 4 hours": ("-4h@h", "now"),
-            "Last 24 hours": ("-24h@h", "now"),
-            "Last 7 days": ("-7d@d", "now"),
-            "Last 30 days": ("-30d@d", "now"),
-            "Today": ("@d", "now"),
-            "Yesterday": ("-1d@d", "@d"),
-            "Previous week": ("-1w@w", "@w"),
-            "Previous month": ("-1mon@mon", "@mon"),
-            "Previous year": ("-1y@y", "@y"),
-            "Week to date": ("@w", "now"),
-            "Month to date": ("@mon", "now"),
-            "Year to date": ("@y", "now"),
-            "All time": ("0", "now"),
-        }
-        presets = list(self.preset_splunk_ranges.keys())
+        presets = list(self.PRESET_SPLUNK_RANGES)
         canvas = tk.Canvas(parent)
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
@@ -291,6 +415,7 @@ class TimeRangeDialog(Toplevel):
         ttk.Label(options_frame, text="ago until now").pack(side=tk.LEFT, padx=5)
 
     def build_date_range_frame(self, parent):
+        from tkcalendar import DateEntry
         frame = ttk.Frame(parent, padding="10")
         frame.pack(fill=tk.BOTH, expand=True)
         ttk.Label(frame, text="Date Range").pack(anchor="w")
@@ -305,6 +430,7 @@ class TimeRangeDialog(Toplevel):
         ttk.Label(controls_frame, text="(00:00:00 to 23:59:59)").pack(side=tk.LEFT, padx=5)
 
     def build_datetime_range_frame(self, parent):
+        from tkcalendar import DateEntry
         frame = ttk.Frame(parent, padding="10")
         frame.pack(fill=tk.BOTH, expand=True)
         ttk.Label(frame, text="Date & Time Range").pack(anchor="w")
@@ -339,7 +465,7 @@ class TimeRangeDialog(Toplevel):
         self.latest_epoch.grid(row=1, column=1, padx=5)
 
     def select_preset(self, preset):
-        splunk_range = self.preset_splunk_ranges.get(preset)
+        splunk_range = self.PRESET_SPLUNK_RANGES.get(preset)
         if splunk_range:
             self.result = {"start": splunk_range[0], "end": splunk_range[1]}
         self.destroy()
@@ -404,18 +530,11 @@ class TimeRangeDialog(Toplevel):
 
     def parse_time(self, time_str: str) -> dt_time:
         """Parse a time string in HH:MM or HH:MM:SS format."""
-        try:
-            parts = time_str.strip().split(':')
-            if len(parts) not in (2, 3):
-                raise ValueError
-            hour = int(parts[0])
-            minute = int(parts[1])
-            second = int(parts[2]) if len(parts) == 3 else 0
-            if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
-                raise ValueError
-            return dt_time(hour, minute, second)
-        except Exception:
+        m = _TIME_RE.match(time_str.strip())
+        if not m:
             raise ValueError("Time must be in HH:MM or HH:MM:SS format and within valid time ranges.")
+        hour, minute, second = m.groups()
+        return dt_time(int(hour), int(minute), int(second or 0))
 
 # ------------------------------------------------------------------------------
 # Main Application Class and All Methods
@@ -427,14 +546,18 @@ class SplunkAutomatorApp:
     def __init__(self, master: tk.Tk):
         self.master = master
         master.title("Splunk Dashboard Automator")
-        master.geometry(self.load_settings().get("geometry", "1200x800"))
+        settings = self.load_settings()
+        master.geometry(settings.get("geometry", "1200x800"))
         self.status_message = tk.StringVar()
-        self.last_group = self.load_settings().get("last_group", "All")
-        self.last_selected_dashboards = self.load_settings().get("last_selected_dashboards", [])
+        self.last_group = settings.get("last_group", "All")
+        self.last_selected_dashboards = settings.get("last_selected_dashboards", [])
         self.username, self.password = load_credentials()
         self.session = {"username": self.username, "password": self.password, "dashboards": []}
         self.scheduled = False
         self.schedule_interval = 0
+        self._all_iids = {}
+        self._hidden_iids = set()
+        self._filter_after_id = None
         self._setup_ui()
         self.load_dashboards()
         if not self.session["username"] or not self.session["password"]:
@@ -467,7 +590,7 @@ class SplunkAutomatorApp:
         self.group_filter_var = tk.StringVar(value=self.last_group)
         self.group_filter = ttk.Combobox(controls_frame, textvariable=self.group_filter_var, state="readonly", width=15)
         self.group_filter.grid(row=0, column=11, padx=5)
-        self.group_filter.bind("<<ComboboxSelected>>", lambda e: self.refresh_dashboard_list())
+        self.group_filter.bind("<<ComboboxSelected>>", self._schedule_group_filter)
         tree_frame = ttk.LabelFrame(main_frame, text="Dashboards")
         tree_frame.grid(row=1, column=0, sticky="nsew")
         main_frame.grid_rowconfigure(1, weight=1)
@@ -619,25 +742,30 @@ class SplunkAutomatorApp:
             self.update_group_filter()
 
     def select_all_dashboards(self):
-        for db in self.session['dashboards']:
-            db['selected'] = True
-        self.refresh_dashboard_list()
+        self._set_all_selected(True)
 
     def deselect_all_dashboards(self):
-        for db in self.session['dashboards']:
-            db['selected'] = False
-        self.refresh_dashboard_list()
+        self._set_all_selected(False)
+
+    def _set_all_selected(self, selected: bool):
+        """Tick or untick every dashboard, updating only the checkbox cells."""
+        selected_char = "☑" if selected else "☐"
+        for iid, db in self._all_iids.items():
+            if db.get('selected', False) != selected:
+                db['selected'] = selected
+                self.treeview.set(iid, "Sel", selected_char)
+        self.save_settings()
 
     def toggle_selection(self, event):
         item_id = self.treeview.identify_row(event.y)
         if not item_id or self.treeview.identify_column(event.x) != "#1":
             return
-        try:
-            db = self.session['dashboards'][int(item_id)]
-            db["selected"] = not db.get("selected", False)
-            self.refresh_dashboard_list()
-        except (IndexError, ValueError):
-            pass
+        db = self._all_iids.get(item_id)
+        if db is None:
+            return
+        db["selected"] = not db.get("selected", False)
+        self.treeview.set(item_id, "Sel", "☑" if db["selected"] else "☐")
+        self.save_settings()
 
     def load_dashboards(self):
         """Load dashboards from file."""
@@ -653,27 +781,57 @@ class SplunkAutomatorApp:
     def save_dashboards(self):
         """Save dashboards to file."""
         try:
-            with open(Config.DASHBOARD_FILE, 'w', encoding='utf-8') as f:
-                dashboards_to_save = [{k: v for k, v in d.items() if k != 'status'} for d in self.session['dashboards']]
-                json.dump(dashboards_to_save, f, indent=4)
-            os.chmod(Config.DASHBOARD_FILE, 0o600)
+            dashboards_to_save = [{k: v for k, v in d.items() if k != 'status'} for d in self.session['dashboards']]
+            atomic_write_bytes(Config.DASHBOARD_FILE, json.dumps(dashboards_to_save, indent=4).encode('utf-8'))
         except Exception as exc:
             logger.exception("Error saving dashboards")
             messagebox.showerror("Save Error", f"Could not save dashboards: {exc}")
 
     def refresh_dashboard_list(self):
+        """Rebuild all rows from the session (after dashboards are added or removed), then apply the group filter."""
         selected_ids = {iid for iid in self.treeview.selection()}
-        self.treeview.delete(*self.treeview.get_children())
-        selected_filter = self.group_filter_var.get()
+        if self._all_iids:
+            self.treeview.delete(*self._all_iids)
+        self._all_iids = {}
         for idx, db in enumerate(self.session['dashboards']):
-            group_name = db.get("group", "Default")
-            if selected_filter == "All" or group_name == selected_filter:
-                status = db.get("status", "Pending")
-                selected_char = "☑" if db.get("selected") else "☐"
-                iid = str(idx)
-                self.treeview.insert("", "end", iid=iid, values=(selected_char, db['name'], db['url'], group_name, status))
-                if iid in selected_ids:
-                    self.treeview.selection_add(iid)
+            status = db.get("status", "Pending")
+            selected_char = "☑" if db.get("selected") else "☐"
+            iid = str(idx)
+            self.treeview.insert("", "end", iid=iid, values=(selected_char, db['name'], db['url'], db.get("group", "Default"), status))
+            self._all_iids[iid] = db
+            if iid in selected_ids:
+                self.treeview.selection_add(iid)
+        # Every row is attached again, in order; the filter only has to detach the hidden ones.
+        self._hidden_iids = set()
+        self._apply_group_filter()
+
+    def _schedule_group_filter(self, event=None):
+        """Coalesce rapid group filter changes into one update."""
+        if self._filter_after_id is not None:
+            self.master.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.master.after(50, self._apply_group_filter)
+
+    def _apply_group_filter(self):
+        """Show only rows of the selected group, detaching or reattaching just the rows whose visibility changed."""
+        self._filter_after_id = None
+        selected_filter = self.group_filter_var.get()
+        if selected_filter == "All":
+            hidden = set()
+        else:
+            hidden = {iid for iid, db in self._all_iids.items() if db.get("group", "Default") != selected_filter}
+        newly_hidden = hidden - self._hidden_iids
+        if newly_hidden:
+            self.treeview.detach(*newly_hidden)
+        if self._hidden_iids - hidden:
+            # Rows still shown are already in order, so each returning row goes in at its position.
+            pos = 0
+            for iid in self._all_iids:
+                if iid in hidden:
+                    continue
+                if iid in self._hidden_iids:
+                    self.treeview.move(iid, "", pos)
+                pos += 1
+        self._hidden_iids = hidden
         self.save_settings()
 
     def update_group_filter(self):
@@ -684,7 +842,8 @@ class SplunkAutomatorApp:
         self.group_filter['values'] = group_filter_values
         if self.group_filter_var.get() not in group_filter_values:
             self.group_filter_var.set("All")
-        self.refresh_dashboard_list()
+        # Callers have just rebuilt the rows, so only the filter needs applying.
+        self._apply_group_filter()
 
     def export_results(self):
         """Export dashboard results to CSV."""
@@ -719,9 +878,8 @@ class SplunkAutomatorApp:
             "last_group": self.group_filter_var.get(),
             "last_selected_dashboards": [d['name'] for d in self.session['dashboards'] if d.get('selected')]
         }
-        with open(Config.SETTINGS_FILE, "w", encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
-        os.chmod(Config.SETTINGS_FILE, 0o600)
+        # Saved from the Tk thread on every filter change, so no fsync here.
+        atomic_write_bytes(Config.SETTINGS_FILE, json.dumps(settings, indent=4).encode('utf-8'), sync=False)
 
     def run_analysis_thread(self, scheduled_run=False, schedule_config=None):
         """Run dashboard analysis in thread after archiving/cleanup."""
@@ -752,17 +910,22 @@ class SplunkAutomatorApp:
         Thread(target=lambda: asyncio.run(self.analyze_dashboards_async(selected_dbs, start_dt, end_dt, retries)), daemon=True).start()
 
     async def analyze_dashboards_async(self, dashboards, start_dt, end_dt, retries=3):
+        from playwright.async_api import async_playwright
         logger.info(f"[LOG] Starting analysis for {len(dashboards)} dashboards.")
         self.progress_bar['maximum'] = len(dashboards)
         ensure_dirs()
         semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DASHBOARDS)
         async with async_playwright() as p:
+            # One browser for the whole run; each dashboard gets its own context.
+            browser = await p.chromium.launch(headless=False)
+            logger.info("[LOG] Launched shared browser for analysis run.")
+
             async def process_dashboard_wrapper(db, idx):
                 async with semaphore:
                     name = db['name']
                     for attempt in range(1, retries + 1):
                         try:
-                            await self.process_single_dashboard(p, db, start_dt, end_dt)
+                            await self.process_single_dashboard(browser, db, start_dt, end_dt)
                             break
                         except Exception as e:
                             logger.warning(f"Attempt {attempt} failed for {name}: {e}")
@@ -770,21 +933,28 @@ class SplunkAutomatorApp:
                             if attempt == retries:
                                 self.update_dashboard_status(name, f"Failed after {retries} retries")
                     self.update_progress(idx+1, len(dashboards))
-            tasks = [process_dashboard_wrapper(db, idx) for idx, db in enumerate(dashboards)]
-            await asyncio.gather(*tasks)
+            try:
+                tasks = [process_dashboard_wrapper(db, idx) for idx, db in enumerate(dashboards)]
+                await asyncio.gather(*tasks)
+            finally:
+                try:
+                    await browser.close()
+                    logger.info("[LOG] Shared browser closed.")
+                except Exception as e:
+                    logger.warning(f"[LOG] Error closing shared browser: {e}")
         self.post_run_cleanup()
         self.update_status("Analysis run has finished.")
         self.master.after(0, lambda: messagebox.showinfo("Complete", "Analysis run has finished."))
 
-    async def process_single_dashboard(self, playwright, db_data, start_dt, end_dt):
+    async def process_single_dashboard(self, browser, db_data, start_dt, end_dt):
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
         name = db_data['name']
         logger.info(f"[LOG] Starting analysis for dashboard '{name}'.")
         self.update_dashboard_status(name, "Launching...")
-        browser = None
+        context = None
         try:
-            browser = await playwright.chromium.launch(headless=False)
-            logger.info(f"[LOG] Launched browser for '{name}'.")
             context = await browser.new_context(ignore_https_errors=True)
+            logger.info(f"[LOG] Opened browser context for '{name}'.")
             page = await context.new_page()
             full_url = self.format_time_for_url(db_data['url'], start_dt, end_dt)
             logger.info(f"[LOG] Dashboard '{name}' - Navigating to URL: {full_url}")
@@ -854,12 +1024,12 @@ class SplunkAutomatorApp:
             logger.error(f"Error processing '{name}': {e}", exc_info=True)
             raise
         finally:
-            if browser:
+            if context:
                 try:
-                    await browser.close()
-                    logger.info(f"[LOG] Browser closed for dashboard '{name}'.")
+                    await context.close()
+                    logger.info(f"[LOG] Browser context closed for dashboard '{name}'.")
                 except Exception as e:
-                    logger.warning(f"[LOG] Error closing browser for '{name}': {e}")
+                    logger.warning(f"[LOG] Error closing browser context for '{name}': {e}")
 
     async def _wait_for_splunk_dashboard_to_load(self, page, name):
         """Wait for Splunk dashboard to fully load (both Studio and Classic)."""
@@ -1012,15 +1182,12 @@ class SplunkAutomatorApp:
         self.master.after(0, lambda: self._update_status_in_ui(name, status))
 
     def _update_status_in_ui(self, name: str, status: str):
-        for iid in self.treeview.get_children():
-            if self.treeview.item(iid)['values'][1] == name:
-                vals = list(self.treeview.item(iid)['values'])
-                vals[4] = status
-                self.treeview.item(iid, values=tuple(vals))
-                for db in self.session['dashboards']:
-                    if db['name'] == name:
-                        db['status'] = status
-                        break
+        # Detached (filtered-out) rows are updated too, so they are current when shown again.
+        for iid, db in self._all_iids.items():
+            if db['name'] == name:
+                self.treeview.set(iid, "Status", status)
+                db['status'] = status
+                break
 
     def update_progress(self, value: int, maximum: int | None = None):
         self.master.after(0, lambda: self._update_progress_in_ui(value, maximum))
@@ -1063,9 +1230,7 @@ class SplunkAutomatorApp:
             "retries": retries
         }
         try:
-            with open(Config.SCHEDULE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(schedule_config, f, indent=4)
-            os.chmod(Config.SCHEDULE_FILE, 0o600)
+            atomic_write_bytes(Config.SCHEDULE_FILE, json.dumps(schedule_config, indent=4).encode('utf-8'))
             messagebox.showinfo("Schedule Saved", f"Analysis scheduled every {interval} minutes.")
             self.scheduled = True
             self.schedule_interval = interval
@@ -6,9 +6,11 @@ This module provides functionality for managing Splunk dashboards and lists
 including creation, deletion, organization, and persistence.
 """
 
+import os
 import json
 import uuid
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 from utils.config import Config, get_current_timestamp, validate_url, sanitize_filename
 
@@ -26,45 +28,68 @@ class DashboardManager:
     def __init__(self):
         """Initialize the dashboard manager"""
         self.dashboards_file = Config.DASHBOARD_FILE
+        self._file_mtime = None
+        # Guards self.dashboards and the file; request threads reload, change
+        # and save concurrently. Re-entrant because the mutators call _save_dashboards.
+        self._lock = threading.RLock()
         self.dashboards = self._load_dashboards()
         
-    def _load_dashboards(self) -> Dict[str, Any]:
+    def _load_dashboards(self, fallback: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Load dashboards from JSON file.
         
+        The file's modification time is only recorded once it has parsed, so
+        a file that could not be read is tried again when it next changes.
+        
+        Args:
+            fallback (dict, optional): Dashboards to keep if the file cannot be read
+            
         Returns:
             dict: Dictionary of dashboard configurations keyed by ID
         """
+        if fallback is None:
+            fallback = {}
         try:
             with open(self.dashboards_file, 'r') as f:
+                mtime = os.fstat(f.fileno()).st_mtime
                 data = json.load(f)
-                logger.info(f"Loaded {len(data)} dashboards from {self.dashboards_file}")
-                return data
         except FileNotFoundError:
             logger.info(f"No existing dashboards file found, creating new one")
-            return {}
+            return fallback
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in dashboards file: {e}")
-            return {}
+            return fallback
         except Exception as e:
             logger.error(f"Error loading dashboards: {e}")
-            return {}
+            return fallback
+        self._file_mtime = mtime
+        logger.info(f"Loaded {len(data)} dashboards from {self.dashboards_file}")
+        return data
             
     def _save_dashboards(self) -> bool:
         """
         Save dashboards to JSON file.
         
+        The file is written to a temporary file and then swapped in, so
+        readers never see a partly written file.
+        
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        try:
-            with open(self.dashboards_file, 'w') as f:
-                json.dump(self.dashboards, f, indent=2, default=str)
-            logger.info(f"Saved {len(self.dashboards)} dashboards to {self.dashboards_file}")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving dashboards: {e}")
-            return False
+        tmp_file = f"{self.dashboards_file}.tmp"
+        with self._lock:
+            try:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.dashboards, f, indent=2, default=str)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.dashboards_file)
+                self._file_mtime = os.stat(self.dashboards_file).st_mtime
+                logger.info(f"Saved {len(self.dashboards)} dashboards to {self.dashboards_file}")
+                return True
+            except Exception as e:
+                logger.error(f"Error saving dashboards: {e}")
+                return False
             
     def add_dashboard(self, name: str, url: str, list_name: Optional[str] = None) -> str:
         """
@@ -81,47 +106,48 @@ class DashboardManager:
         Raises:
             ValueError: If name/URL invalid or dashboard already exists
         """
-        # Validate inputs
-        if not name or not name.strip():
-            raise ValueError("Dashboard name cannot be empty")
+        with self._lock:
+            # Validate inputs
+            if not name or not name.strip():
+                raise ValueError("Dashboard name cannot be empty")
             
-        if not url or not url.strip():
-            raise ValueError("Dashboard URL cannot be empty")
+            if not url or not url.strip():
+                raise ValueError("Dashboard URL cannot be empty")
             
-        if not validate_url(url):
-            raise ValueError("Invalid URL format")
+            if not validate_url(url):
+                raise ValueError("Invalid URL format")
             
-        # Check for duplicate names
-        for dashboard in self.dashboards.values():
-            if dashboard['name'].lower() == name.strip().lower():
-                raise ValueError(f"Dashboard with name '{name}' already exists")
+            # Check for duplicate names
+            for dashboard in self.dashboards.values():
+                if dashboard['name'].lower() == name.strip().lower():
+                    raise ValueError(f"Dashboard with name '{name}' already exists")
                 
-        # Generate unique ID
-        dashboard_id = str(uuid.uuid4())
-        
-        # Create dashboard object
-        dashboard = {
-            'id': dashboard_id,
-            'name': name.strip(),
-            'url': url.strip(),
-            'list_name': list_name.strip() if list_name else None,
-            'created_at': get_current_timestamp(),
-            'last_captured': None,
-            'capture_count': 0,
-            'active': True
-        }
-        
-        # Add to collection
-        self.dashboards[dashboard_id] = dashboard
-        
-        # Save to file
-        if self._save_dashboards():
-            logger.info(f"Added dashboard: {name} (ID: {dashboard_id})")
-            return dashboard_id
-        else:
-            # Rollback on save failure
-            del self.dashboards[dashboard_id]
-            raise Exception("Failed to save dashboard to file")
+            # Generate unique ID
+            dashboard_id = str(uuid.uuid4())
+        
+            # Create dashboard object
+            dashboard = {
+                'id': dashboard_id,
+                'name': name.strip(),
+                'url': url.strip(),
+                'list_name': list_name.strip() if list_name else None,
+                'created_at': get_current_timestamp(),
+                'last_captured': None,
+                'capture_count': 0,
+                'active': True
+            }
+        
+            # Add to collection
+            self.dashboards[dashboard_id] = dashboard
+        
+            # Save to file
+            if self._save_dashboards():
+                logger.info(f"Added dashboard: {name} (ID: {dashboard_id})")
+                return dashboard_id
+            else:
+                # Rollback on save failure
+                del self.dashboards[dashboard_id]
+                raise Exception("Failed to save dashboard to file")
             
     def update_dashboard(self, dashboard_id: str, name: Optional[str] = None, 
                         url: Optional[str] = None, list_name: Optional[str] = None) -> bool:
@@ -140,35 +166,36 @@ class DashboardManager:
         Raises:
             ValueError: If dashboard not found or invalid parameters
         """
-        if dashboard_id not in self.dashboards:
-            raise ValueError(f"Dashboard with ID '{dashboard_id}' not found")
+        with self._lock:
+            if dashboard_id not in self.dashboards:
+                raise ValueError(f"Dashboard with ID '{dashboard_id}' not found")
             
-        dashboard = self.dashboards[dashboard_id]
+            dashboard = self.dashboards[dashboard_id]
         
-        # Update fields if provided
-        if name is not None:
-            if not name.strip():
-                raise ValueError("Dashboard name cannot be empty")
-            dashboard['name'] = name.strip()
+            # Update fields if provided
+            if name is not None:
+                if not name.strip():
+                    raise ValueError("Dashboard name cannot be empty")
+                dashboard['name'] = name.strip()
             
-        if url is not None:
-            if not url.strip():
-                raise ValueError("Dashboard URL cannot be empty")
-            if not validate_url(url):
-                raise ValueError("Invalid URL format")
-            dashboard['url'] = url.strip()
+            if url is not None:
+                if not url.strip():
+                    raise ValueError("Dashboard URL cannot be empty")
+                if not validate_url(url):
+                    raise ValueError("Invalid URL format")
+                dashboard['url'] = url.strip()
             
-        if list_name is not None:
-            dashboard['list_name'] = list_name.strip() if list_name else None
+            if list_name is not None:
+                dashboard['list_name'] = list_name.strip() if list_name else None
             
-        dashboard['updated_at'] = get_current_timestamp()
+            dashboard['updated_at'] = get_current_timestamp()
         
-        # Save changes
-        if self._save_dashboards():
-            logger.info(f"Updated dashboard: {dashboard['name']} (ID: {dashboard_id})")
-            return True
-        else:
-            raise Exception("Failed to save dashboard updates")
+            # Save changes
+            if self._save_dashboards():
+                logger.info(f"Updated dashboard: {dashboard['name']} (ID: {dashboard_id})")
+                return True
+            else:
+                raise Exception("Failed to save dashboard updates")
             
     def delete_dashboard(self, dashboard_id: str) -> bool:
         """
@@ -183,17 +210,18 @@ class DashboardManager:
         Raises:
             ValueError: If dashboard not found
         """
-        if dashboard_id not in self.dashboards:
-            raise ValueError(f"Dashboard with ID '{dashboard_id}' not found")
+        with self._lock:
+            if dashboard_id not in self.dashboards:
+                raise ValueError(f"Dashboard with ID '{dashboard_id}' not found")
             
-        dashboard_name = self.dashboards[dashboard_id]['name']
-        del self.dashboards[dashboard_id]
+            dashboard_name = self.dashboards[dashboard_id]['name']
+            del self.dashboards[dashboard_id]
         
-        if self._save_dashboards():
-            logger.info(f"Deleted dashboard: {dashboard_name} (ID: {dashboard_id})")
-            return True
-        else:
-            raise Exception("Failed to save after dashboard deletion")
+            if self._save_dashboards():
+                logger.info(f"Deleted dashboard: {dashboard_name} (ID: {dashboard_id})")
+                return True
+            else:
+                raise Exception("Failed to save after dashboard deletion")
             
     def get_dashboard(self, dashboard_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -216,6 +244,30 @@ class DashboardManager:
         """
         return self.dashboards.copy()
         
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all dashboards and list names in a single call.
+        
+        The dashboards file is only re-read if it changed on disk since it
+        was last loaded or saved.
+        
+        Returns:
+            dict: {'dashboards': dashboards keyed by ID, 'lists': sorted list names}
+        """
+        # Request threads call this concurrently, so only one of them checks and
+        # reloads the file; if the file can't be parsed the last good data is kept.
+        with self._lock:
+            try:
+                mtime = os.stat(self.dashboards_file).st_mtime
+            except OSError:
+                mtime = None
+            if mtime is not None and mtime != self._file_mtime:
+                self.dashboards = self._load_dashboards(fallback=self.dashboards)
+            dashboards = self.dashboards
+            
+        lists = sorted({d['list_name'] for d in dashboards.values() if d.get('list_name')})
+        return {'dashboards': dashboards.copy(), 'lists': lists}
+        
     def get_dashboards_by_list(self, list_name: str) -> Dict[str, Any]:
         """
         Get all dashboards in a specific list.
@@ -243,20 +295,21 @@ class DashboardManager:
         Returns:
             bool: True if updated successfully
         """
-        if dashboard_id not in self.dashboards:
-            logger.warning(f"Cannot update stats for unknown dashboard: {dashboard_id}")
-            return False
+        with self._lock:
+            if dashboard_id not in self.dashboards:
+                logger.warning(f"Cannot update stats for unknown dashboard: {dashboard_id}")
+                return False
             
-        dashboard = self.dashboards[dashboard_id]
-        dashboard['capture_count'] = dashboard.get('capture_count', 0) + 1
+            dashboard = self.dashboards[dashboard_id]
+            dashboard['capture_count'] = dashboard.get('capture_count', 0) + 1
         
-        if success:
-            dashboard['last_captured'] = get_current_timestamp()
-            dashboard['last_capture_status'] = 'success'
-        else:
-            dashboard['last_capture_status'] = 'failed'
+            if success:
+                dashboard['last_captured'] = get_current_timestamp()
+                dashboard['last_capture_status'] = 'success'
+            else:
+                dashboard['last_capture_status'] = 'failed'
             
-        return self._save_dashboards()
+            return self._save_dashboards()
 
 
 class ListManager:
@@ -35,6 +35,8 @@ class CredentialManager:
         self.key_file = Config.SECRETS_KEY_FILE
         self.credentials_file = Config.SECRETS_FILE
         self.fernet = None
+        self._cached_credentials = None  # Decrypted (username, password) after first load
+        self._cached_mtime_ns = None  # st_mtime_ns of the credentials file the cache came from
         self._initialize_encryption()
     
     def _initialize_encryption(self):
@@ -137,6 +139,10 @@ class CredentialManager:
             # Set secure permissions
             self._set_secure_permissions(self.credentials_file)
             
+            # Refresh the in-memory copy so later loads skip the decrypt
+            self._cached_credentials = (credentials["username"], credentials["password"])
+            self._cached_mtime_ns = os.stat(self.credentials_file).st_mtime_ns
+            
             logger.info(f"Credentials saved successfully for user: {username}")
             return True
             
@@ -156,10 +162,18 @@ class CredentialManager:
             logger.error("Encryption not initialized")
             return None, None
         
-        if not os.path.exists(self.credentials_file):
+        try:
+            mtime_ns = os.stat(self.credentials_file).st_mtime_ns
+        except FileNotFoundError:
+            self._cached_credentials = None
             logger.info("No credentials file found")
             return None, None
         
+        # Serve from memory unless the file changed since it was decrypted
+        # (same st_mtime_ns the /api/credentials ETag is built from)
+        if self._cached_credentials is not None and self._cached_mtime_ns == mtime_ns:
+            return self._cached_credentials
+        
         try:
             # Read encrypted data
             with open(self.credentials_file, "rb") as f:
@@ -174,6 +188,8 @@ class CredentialManager:
             
             if username and password:
                 logger.info(f"Credentials loaded successfully for user: {username}")
+                self._cached_credentials = (username, password)
+                self._cached_mtime_ns = mtime_ns
                 return username, password
             else:
                 logger.warning("Credentials file contains invalid data")
@@ -193,6 +209,7 @@ class CredentialManager:
             bool: True if deletion was successful, False otherwise
         """
         try:
+            self._cached_credentials = None
             if os.path.exists(self.credentials_file):
                 os.remove(self.credentials_file)
                 logger.info("Credentials file deleted successfully")
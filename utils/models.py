@@ -0,0 +1,234 @@
+"""
+Data Models
+===========
+
+This module defines the fixed-schema records built by the web API for
+dashboards, schedules and credentials, and for the smaller payloads of the
+list, delete, screenshot and schedule-id requests. They are slotted dataclasses, which
+are smaller and faster to construct than plain dictionaries, and are
+converted to dictionaries only when handed to the managers or returned as
+JSON.
+
+Each model lists the request fields it accepts in REQUEST_FIELDS and strips
+its text fields in __post_init__, so request parsing and validation happen
+in one place per endpoint.
+"""
+
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, List, Any, Tuple
+
+
+def clean_text(value: str) -> str:
+    """
+    Strip surrounding whitespace, returning the original string when there
+    is nothing to strip so no new string is allocated.
+
+    Args:
+        value (str): Text from a request payload
+
+    Returns:
+        str: Text without leading or trailing whitespace
+    """
+    if not value or not (value[0].isspace() or value[-1].isspace()):
+        return value
+    return value.strip()
+
+
+def _from_request(cls, data: Dict[str, Any], **overrides):
+    """
+    Build a model from a request payload.
+
+    Args:
+        cls: Model class to build
+        data (Dict[str, Any]): Parsed JSON request body
+        **overrides: Server-side field values (e.g. id, created_at)
+
+    Returns:
+        An instance of cls built from the accepted request fields
+    """
+    values = {name: data[name] for name in cls.REQUEST_FIELDS if name in data}
+    values.update(overrides)
+    return cls(**values)
+
+
+@dataclass(slots=True)
+class Dashboard:
+    """A Splunk dashboard as submitted through the web API."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('name', 'url', 'lists')
+
+    id: str
+    name: str = ''
+    url: str = ''
+    lists: List[str] = field(default_factory=list)
+    selected: bool = False
+    status: str = 'Ready'
+    created_at: str = ''
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        self.name = clean_text(self.name)
+        self.url = clean_text(self.url)
+        # A JSON null is treated like an omitted field
+        if self.lists is None:
+            self.lists = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the dashboard to a dictionary.
+
+        Returns:
+            Dict[str, Any]: Dashboard fields keyed by name
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'url': self.url,
+            'lists': list(self.lists),
+            'selected': self.selected,
+            'status': self.status,
+            'created_at': self.created_at,
+        }
+
+
+@dataclass(slots=True)
+class Schedule:
+    """A screenshot schedule as submitted through the web API."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'name', 'dashboard_ids', 'schedule_type', 'schedule_time',
+        'time_range', 'include_watermark'
+    )
+
+    id: str
+    name: str = ''
+    dashboard_ids: List[str] = field(default_factory=list)
+    schedule_type: str = 'once'
+    schedule_time: str = ''
+    time_range: Dict[str, Any] = field(default_factory=dict)
+    include_watermark: bool = True
+    active: bool = True
+    created_at: str = ''
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        self.name = clean_text(self.name)
+        # A JSON null is treated like an omitted field
+        if self.dashboard_ids is None:
+            self.dashboard_ids = []
+        if self.time_range is None:
+            self.time_range = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the schedule to a dictionary.
+
+        Returns:
+            Dict[str, Any]: Schedule fields keyed by name
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'dashboard_ids': list(self.dashboard_ids),
+            'schedule_type': self.schedule_type,
+            'schedule_time': self.schedule_time,
+            'time_range': dict(self.time_range),
+            'include_watermark': self.include_watermark,
+            'active': self.active,
+            'created_at': self.created_at,
+        }
+
+
+@dataclass(slots=True)
+class Credentials:
+    """Splunk credentials as submitted through the web API."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('username', 'password')
+
+    username: str = ''
+    password: str = ''
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        self.username = clean_text(self.username)
+        self.password = clean_text(self.password)
+
+
+@dataclass(slots=True)
+class ListIn:
+    """A dashboard list name, as sent to create or delete a list."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('name',)
+
+    name: str = ''
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        self.name = clean_text(self.name)
+
+
+@dataclass(slots=True)
+class RenameIn:
+    """A request to rename a dashboard list."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('old_name', 'new_name')
+
+    old_name: str = ''
+    new_name: str = ''
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        self.old_name = clean_text(self.old_name)
+        self.new_name = clean_text(self.new_name)
+
+
+@dataclass(slots=True)
+class DeleteIn:
+    """The IDs of the dashboards to delete."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('ids',)
+
+    ids: List[str] = field(default_factory=list)
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        # A JSON null is treated like an omitted field
+        if self.ids is None:
+            self.ids = []
+
+
+@dataclass(slots=True)
+class IdIn:
+    """The ID of a single dashboard or schedule to update or delete."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('id',)
+
+    id: str = ''
+
+    from_request = classmethod(_from_request)
+
+
+@dataclass(slots=True)
+class ScreenshotIn:
+    """A request to capture screenshots of some dashboards."""
+
+    REQUEST_FIELDS: ClassVar[Tuple[str, ...]] = ('dashboard_ids', 'include_watermark', 'time_range')
+
+    dashboard_ids: List[str] = field(default_factory=list)
+    include_watermark: bool = True
+    time_range: Dict[str, Any] = field(default_factory=dict)
+
+    from_request = classmethod(_from_request)
+
+    def __post_init__(self):
+        # A JSON null is treated like an omitted field
+        if self.dashboard_ids is None:
+            self.dashboard_ids = []
+        if self.time_range is None:
+            self.time_range = {}
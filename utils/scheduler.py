@@ -226,6 +226,15 @@ class ScheduleManager:
         """
         return list(self.schedules.values())
     
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all schedule data needed to render a page in a single call.
+        
+        Returns:
+            Dict[str, Any]: {'schedules': list of all schedules}
+        """
+        return {'schedules': list(self.schedules.values())}
+    
     def get_schedule(self, schedule_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific schedule by ID.
@@ -16,6 +16,7 @@ import logging
 import os
 import io
 import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
@@ -39,11 +40,20 @@ class ScreenshotManager:
     - Error handling and retry logic
     """
     
-    def __init__(self):
-        """Initialize the screenshot manager."""
+    def __init__(self, executor: Optional[Executor] = None):
+        """
+        Initialize the screenshot manager.
+        
+        Args:
+            executor (Executor, optional): Bounded pool for the blocking watermark
+                and file work; a private pool is created if none is given
+        """
         self.max_concurrent = Config.MAX_CONCURRENT_SCREENSHOTS
         self.timeout = Config.SCREENSHOT_TIMEOUT * 1000  # Convert to milliseconds
         self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix='screenshot-io')
+        self.executor = executor
         
         # Ensure required directories exist
         self._ensure_directories()
@@ -175,20 +185,19 @@ class ScreenshotManager:
                                 type='png'
                             )
                             
-                            # Process screenshot (add watermark if requested)
-                            if include_watermark:
-                                screenshot_bytes = self._add_watermark(screenshot_bytes, dashboard['name'])
-                            
-                            # Save screenshot
-                            filename = self._generate_filename(dashboard['name'])
-                            file_path = self._save_screenshot(screenshot_bytes, filename)
+                            # Watermark and save on the worker pool, so PIL and file I/O
+                            # don't hold up the other captures running on this event loop
+                            file_path, file_size = await asyncio.get_running_loop().run_in_executor(
+                                self.executor, self._finish_screenshot,
+                                screenshot_bytes, dashboard['name'], include_watermark
+                            )
                             
                             return {
                                 'success': True,
                                 'dashboard_id': dashboard['id'],
                                 'dashboard_name': dashboard['name'],
                                 'file_path': file_path,
-                                'file_size': len(screenshot_bytes),
+                                'file_size': file_size,
                                 'timestamp': get_current_timestamp()
                             }
                         else:
@@ -528,6 +537,26 @@ class ScreenshotManager:
             # Return original screenshot if watermark fails
             return screenshot_bytes
     
+    def _finish_screenshot(self, screenshot_bytes: bytes, dashboard_name: str,
+                           include_watermark: bool) -> Tuple[str, int]:
+        """
+        Watermark (if requested) and save a screenshot. This blocks, so it is
+        run on the worker pool.
+        
+        Args:
+            screenshot_bytes (bytes): Screenshot data from the browser
+            dashboard_name (str): Name of the dashboard
+            include_watermark (bool): Whether to add the watermark
+            
+        Returns:
+            Tuple[str, int]: Path of the saved file and its size in bytes
+        """
+        if include_watermark:
+            screenshot_bytes = self._add_watermark(screenshot_bytes, dashboard_name)
+        filename = self._generate_filename(dashboard_name)
+        file_path = self._save_screenshot(screenshot_bytes, filename)
+        return file_path, len(screenshot_bytes)
+    
     def _generate_filename(self, dashboard_name: str) -> str:
         """
         Generate a safe filename for the screenshot.